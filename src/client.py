@@ -1,22 +1,133 @@
+import json
 import os
+import socket
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-from binance.client import Client  # type: ignore
+if TYPE_CHECKING:
+    from binance.client import Client  # type: ignore
+
+_KEEPALIVE_OPTIONS = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+if hasattr(socket, "TCP_KEEPIDLE"):  # not available on macOS / Windows
+    _KEEPALIVE_OPTIONS.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60))
+
+
+def _create_client() -> "Client":
+    """Create a Binance client whose session reuses pooled keepalive connections."""
+    # imported here since python-binance and requests are slow to import
+    # and only needed online
+    from binance.client import Client  # type: ignore
+    from requests.adapters import HTTPAdapter
+    from urllib3.connection import HTTPConnection
+    from urllib3.util.retry import Retry
+
+    class _KeepAliveAdapter(HTTPAdapter):
+        """HTTP adapter whose pooled connections have TCP keepalive enabled."""
+
+        def init_poolmanager(self, *args, **kwargs):
+            kwargs.setdefault("socket_options", HTTPConnection.default_socket_options + _KEEPALIVE_OPTIONS)
+            super().init_poolmanager(*args, **kwargs)
+
+    client = Client(os.getenv("BINANCE_API_KEY"), os.getenv("BINANCE_SECRET_KEY"), ping=False)
+    # only retry reads: orders (POST) and cancels (DELETE) may have reached
+    # Binance before the failure, and resending them is not idempotent
+    adapter = _KeepAliveAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.2, allowed_methods=frozenset({"GET", "HEAD"})),
+    )
+    client.session.mount("https://", adapter)
+    client.ping()  # warm up DNS and TLS through the pooled adapter
+    return client
 
 
 class BinanceClient:
 
-    _CLIENT = Client(os.getenv("BINANCE_API_KEY"), os.getenv("BINANCE_SECRET_KEY"))
+    _CLIENT: "Client | None" = None
+    _CLIENT_LOCK = threading.Lock()
     _EXCHANGE_INFO: dict | None = None
+    _EXCHANGE_INFO_LOCK = threading.Lock()
+    _FILTER_INDEX: dict[tuple[str, str], dict[str, float]] = {}
+    _FILTER_INDEX_SOURCE: dict | None = None  # the exchange info _FILTER_INDEX was built from
+    _CACHE_PATH = Path.home() / ".cache" / "binance_bot_lab" / "exchange_info.json"
+    _CACHE_TTL = 3600  # seconds
 
     @classmethod
-    def get_client(cls) -> Client:
+    def get_client(cls) -> "Client":
+        if cls._CLIENT is None:
+            with cls._CLIENT_LOCK:
+                if cls._CLIENT is None:  # another thread may have created it meanwhile
+                    cls._CLIENT = _create_client()
         return cls._CLIENT
     
     @classmethod
     def get_exchange_info(cls) -> dict:
+        """Get the exchange info, loading it from the on-disk cache if it is
+        younger than `_CACHE_TTL` seconds and fetching it otherwise.
+
+        Returns:
+            (dict) The exchange info returned by Binance.
+        """
         if cls._EXCHANGE_INFO is None:
-            cls._EXCHANGE_INFO = cls._CLIENT.get_exchange_info()
+            with cls._EXCHANGE_INFO_LOCK:
+                if cls._EXCHANGE_INFO is None:
+                    exchange_info = cls._load_cached_exchange_info()
+                    if exchange_info is None:
+                        exchange_info = cls.get_client().get_exchange_info()
+                        cls._save_cached_exchange_info(exchange_info)
+                    cls._EXCHANGE_INFO = exchange_info
         return cls._EXCHANGE_INFO
+
+    @classmethod
+    def _get_filter_index(cls) -> dict[tuple[str, str], dict[str, float]]:
+        """Get the filter index, rebuilding it whenever the exchange info changed."""
+        exchange_info = cls.get_exchange_info()
+        if cls._FILTER_INDEX_SOURCE is not exchange_info:
+            cls._FILTER_INDEX = cls._build_filter_index(exchange_info)
+            cls._FILTER_INDEX_SOURCE = exchange_info
+        return cls._FILTER_INDEX
+
+    @staticmethod
+    def _build_filter_index(exchange_info: dict) -> dict[tuple[str, str], dict[str, float]]:
+        """Index the tick and step sizes of every symbol by (base, quote) asset."""
+        index = {}
+        for symbol_info in exchange_info["symbols"]:
+            sizes = {}
+            for filter in symbol_info["filters"]:
+                if filter["filterType"] == "PRICE_FILTER":
+                    sizes["tick"] = float(filter["tickSize"])
+                elif filter["filterType"] == "LOT_SIZE":
+                    sizes["step"] = float(filter["stepSize"])
+            index[(symbol_info["baseAsset"], symbol_info["quoteAsset"])] = sizes
+        return index
+
+    @classmethod
+    def _load_cached_exchange_info(cls) -> dict | None:
+        try:
+            if time.time() - cls._CACHE_PATH.stat().st_mtime > cls._CACHE_TTL:
+                return None
+            with cls._CACHE_PATH.open() as f:
+                exchange_info = json.load(f)
+        except (OSError, ValueError):
+            return None
+        # anything other than an exchange info payload is treated as a cache miss
+        if not isinstance(exchange_info, dict) or "symbols" not in exchange_info:
+            return None
+        return exchange_info
+
+    @classmethod
+    def _save_cached_exchange_info(cls, exchange_info: dict) -> None:
+        # write to a temporary file first so readers never see a partial file
+        tmp_path = cls._CACHE_PATH.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            cls._CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with tmp_path.open("w") as f:
+                json.dump(exchange_info, f)
+            os.replace(tmp_path, cls._CACHE_PATH)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
     
     @classmethod
     def get_tick_size(cls, base_asset: str, quote_asset: str) -> float:
@@ -33,44 +144,44 @@ class BinanceClient:
         Returns:
             (float) The tick size for the given base and quote asset.
         """
-        if cls._EXCHANGE_INFO is None:
-            cls._EXCHANGE_INFO = cls._CLIENT.get_exchange_info()
-
         base_asset = base_asset.upper()
         quote_asset = quote_asset.upper()
 
-        for symbol_info in cls._EXCHANGE_INFO["symbols"]:
-            if symbol_info["baseAsset"] == base_asset and symbol_info["quoteAsset"] == quote_asset:
-                for filter in symbol_info["filters"]:
-                    if filter["filterType"] == "PRICE_FILTER":
-                        return float(filter["tickSize"])
-        else:
+        sizes = cls._get_filter_index().get((base_asset, quote_asset), {})
+        if "tick" not in sizes:
             raise ValueError(f"No tick size found for {base_asset}{quote_asset}")
+        return sizes["tick"]
 
 
     @classmethod
-    def get_step_size(cls, base_asset: str) -> float:
+    def get_step_size(cls, base_asset: str, quote_asset: str | None = None) -> float:
         """Get the step size for a given base asset.
         
         Step size is the minimum increment for a given asset, 
-        which is independent of the quote asset. For example, 
-        the step size for ETH is 0.0001.
+        which is usually independent of the quote asset. For example, 
+        the step size for ETH is 0.0001. Since Binance defines it per
+        symbol, pass the quote asset to get the exact value.
 
         Args:
             base_asset (str): The base asset to get the step size for.
+            quote_asset (str | None): The quote asset of the symbol. If omitted,
+                the first symbol with the given base asset is used.
 
         Returns:
             (float) The step size for the given base asset.
         """
         base_asset = base_asset.upper()
 
-        if cls._EXCHANGE_INFO is None:
-            cls._EXCHANGE_INFO = cls._CLIENT.get_exchange_info()
+        filter_index = cls._get_filter_index()
+        if quote_asset is not None:
+            quote_asset = quote_asset.upper()
+            sizes = filter_index.get((base_asset, quote_asset), {})
+            if "step" not in sizes:
+                raise ValueError(f"No step size found for {base_asset}{quote_asset}")
+            return sizes["step"]
 
-        for symbol_info in cls._EXCHANGE_INFO["symbols"]:
-            if symbol_info["baseAsset"] == base_asset:
-                for filter in symbol_info["filters"]:
-                    if filter["filterType"] == "LOT_SIZE":
-                        return float(filter["stepSize"])
+        for (symbol_base, _), sizes in filter_index.items():
+            if symbol_base == base_asset and "step" in sizes:
+                return sizes["step"]
         else:
             raise ValueError(f"No step size found for {base_asset}")
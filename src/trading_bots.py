@@ -26,11 +26,11 @@ class GridBot:
         self.mode = mode.lower()
 
         self._tick_size = BinanceClient.get_tick_size(self.base_asset, self.quote_asset)
-        self._step_size = BinanceClient.get_step_size(self.base_asset)
+        self._step_size = BinanceClient.get_step_size(self.base_asset, self.quote_asset)
         self._generate_grid_levels()
 
     @property
-    def grid_levels(self) -> list[float]:
+    def grid_levels(self) -> np.ndarray:
         return self._grid_levels
     
     @property
@@ -44,32 +44,31 @@ class GridBot:
     def _generate_grid_levels(self) -> None:
         """Generate the grid levels for the bot."""
 
-        self._grid_levels = []
-
         if self.mode == "arithmetic":
             self.grid_interval = (self.upper_price - self.lower_price) / self.grid_number
-            for i in range(self.grid_number):
-                price = self.lower_price + i * self.grid_interval
-                price = (price // self._tick_size) * self._tick_size  # round to the nearest tick size
-                self._grid_levels.append(price)
+            levels = np.linspace(self.lower_price, self.upper_price, self.grid_number, endpoint=False)
         else:
-            ratio = (self.upper_price / self.lower_price) ** (1 / self.grid_number)
-            for i in range(self.grid_number):
-                price = self.lower_price * ratio ** i
-                price = (price // self._tick_size) * self._tick_size  # round to the nearest tick size
-                self._grid_levels.append(price)
+            levels = np.geomspace(self.lower_price, self.upper_price, self.grid_number, endpoint=False)
 
-        self._grid_levels.append(self.upper_price)
+        # round down to the tick size; the tolerance of a few ulps keeps prices
+        # that are already on a tick (e.g. 1.15 / 0.01) from dropping a tick
+        ticks = levels * (1.0 / self._tick_size)
+        levels = np.floor(ticks + np.maximum(1e-9, 16 * np.spacing(ticks))) * self._tick_size
+        self._grid_levels = np.append(levels, self.upper_price)
 
     def order_count(self, price: float, align: bool = False) -> tuple[int, int]:
         if align:
             price = self.closest_grid_level(price)
-        buy_count = sum(price > level for level in self._grid_levels)
-        sell_count = sum(price < level for level in self._grid_levels)
+        # grid levels are sorted ascending, so both counts are binary searches
+        buy_count = np.searchsorted(self._grid_levels, price, side="left")
+        sell_count = len(self._grid_levels) - np.searchsorted(self._grid_levels, price, side="right")
         return int(buy_count), int(sell_count)
     
     def closest_grid_level(self, price: float) -> float:
-        return self._grid_levels[np.argmin(np.abs(np.array(self._grid_levels) - price))]
+        idx = np.searchsorted(self._grid_levels, price)
+        left = self._grid_levels[max(idx - 1, 0)]
+        right = self._grid_levels[min(idx, len(self._grid_levels) - 1)]
+        return left if price - left <= right - price else right
 
 
 class FuturesGridBot(GridBot):
@@ -105,6 +104,8 @@ class FuturesGridBot(GridBot):
         position_size: float,
         maintenance_amount: float = 0.0,
     ):
+        if position_size <= 0:
+            raise ValueError("Position size must be positive")
         side = 1 if direction == "long" else -1
         total_balance = wallet_balance + maintenance_amount
         notional_value = position_size * entry_price